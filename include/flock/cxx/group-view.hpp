@@ -13,6 +13,7 @@
 #include <map>
 #include <vector>
 #include <string>
+#include <string_view>
 #include <functional>
 
 namespace flock {
@@ -128,6 +129,13 @@ class GroupView {
         FLOCK_GROUP_VIEW_MOVE(&view, &m_view);
     }
 
+    static GroupView FromString(std::string_view str) {
+        flock_group_view_t view = FLOCK_GROUP_VIEW_INITIALIZER;
+        auto ret = flock_group_view_from_string(str.data(), str.size(), &view);
+        if(ret != FLOCK_SUCCESS) throw Exception{ret};
+        return GroupView{view};
+    }
+
     ~GroupView() {
         clear();
     }
@@ -169,14 +177,8 @@ class GroupView {
 
     auto copy() const {
         auto result = GroupView{};
-        auto members = const_cast<GroupView*>(this)->members();
-        for(size_t i = 0; i < members.count(); ++i) {
-            result.members().add(members[i].address.c_str(), members[i].provider_id);
-        }
-        auto metadata = const_cast<GroupView*>(this)->metadata();
-        for(size_t i = 0; i < metadata.count(); ++i) {
-            result.metadata().add(metadata[i].key.c_str(), metadata[i].value.c_str());
-        }
+        if(!flock_group_view_copy(&m_view, &result.m_view))
+            throw Exception{FLOCK_ERR_ALLOCATION};
         return result;
     }
 
@@ -191,6 +193,11 @@ class GroupView {
         return result;
     }
 
+    void serializeToFile(const char* filename) const {
+        auto ret = flock_group_view_serialize_to_file(&m_view, filename);
+        if(ret != FLOCK_SUCCESS) throw Exception{ret};
+    }
+
     private:
 
     flock_group_view_t m_view = FLOCK_GROUP_VIEW_INITIALIZER;
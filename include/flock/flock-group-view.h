@@ -636,6 +636,66 @@ static inline size_t flock_group_view_metadata_count(flock_group_view_t* view)
     return view->metadata.size;
 }
 
+/**
+ * @brief Copy the content of a view into another view.
+ *
+ * @important The destination view is assumed to be empty. Since the
+ * source view is already sorted, its arrays are copied as-is instead of
+ * inserting each entry. The extra fields of the members are not copied.
+ *
+ * @param src View to copy.
+ * @param dst View into which to copy.
+ *
+ * @return true if the view was copied, false in case of allocation error.
+ */
+static inline bool flock_group_view_copy(
+        const flock_group_view_t* src,
+        flock_group_view_t* dst)
+{
+    if (src->members.size) {
+        dst->members.data = (flock_member_t*)calloc(
+            src->members.size, sizeof(flock_member_t));
+        if (!dst->members.data) return false;
+        dst->members.capacity = src->members.size;
+        for (size_t i = 0; i < src->members.size; ++i) {
+            char* address = strdup(src->members.data[i].address);
+            if (!address) {
+                flock_group_view_clear(dst);
+                return false;
+            }
+            dst->members.data[i].address     = address;
+            dst->members.data[i].provider_id = src->members.data[i].provider_id;
+            ++dst->members.size;
+        }
+    }
+
+    if (src->metadata.size) {
+        dst->metadata.data = (flock_metadata_t*)calloc(
+            src->metadata.size, sizeof(flock_metadata_t));
+        if (!dst->metadata.data) {
+            flock_group_view_clear(dst);
+            return false;
+        }
+        dst->metadata.capacity = src->metadata.size;
+        for (size_t i = 0; i < src->metadata.size; ++i) {
+            char* key   = strdup(src->metadata.data[i].key);
+            char* value = strdup(src->metadata.data[i].value);
+            if (!key || !value) {
+                free(key);
+                free(value);
+                flock_group_view_clear(dst);
+                return false;
+            }
+            dst->metadata.data[i].key   = key;
+            dst->metadata.data[i].value = value;
+            ++dst->metadata.size;
+        }
+    }
+
+    dst->digest = src->digest;
+    return true;
+}
+
 /**
  * @brief Serialize a flock_group_view_t and pass the serialized string
  * to a serializer function pointer.
@@ -12,17 +12,40 @@
 """
 
 
+from __future__ import annotations
+
+import itertools
+import os
+import weakref
 import pyflock_common
-import pyflock_client
-import pymargo.core
-import pymargo
+
+# pyflock_client and pymargo are imported by _import_dependencies() when the
+# first Client is created; until then, these module attributes are None.
+pyflock_client = None
+pymargo = None
+
+
+def _import_dependencies():
+    global pyflock_client, pymargo
+    if pyflock_client is not None:
+        return
+    import pymargo.core
+    import pyflock_client
+
+
+# Source of view versions for GroupHandle; next() on it is atomic under the GIL
+_view_versions = itertools.count(1)
 
 
 class GroupHandle:
 
+    __slots__ = ('_internal', '_client', '_view_version', '_view_cache', '__weakref__')
+
     def __init__(self, internal, client):
         self._internal = internal
         self._client = client
+        self._view_version = 0
+        self._view_cache = None
 
     @property
     def client(self):
@@ -30,15 +53,35 @@ class GroupHandle:
 
     def update(self):
         self._internal.update()
+        self._view_version = next(_view_versions)
 
     @property
     def view(self):
-        return self._internal.view
+        """
+        Return the view of the group as of the last call to update().
+
+        The returned GroupView is shared by every caller of this handle
+        (including other users of the same handle obtained from the client's
+        handle cache) until the next update(). It must not be modified;
+        call view.copy() to get a private, modifiable view.
+        """
+        # The version is read before fetching the view, so a view fetched
+        # concurrently with an update() is tagged with the old version and
+        # replaced on the next access.
+        version = self._view_version
+        cache = self._view_cache
+        if cache is None or cache[0] != version:
+            cache = (version, self._internal.view)
+            self._view_cache = cache
+        return cache[1]
 
 
 class Client:
 
+    __slots__ = ('_engine', '_owns_engine', '_internal', '_mid', '_handle_cache')
+
     def __init__(self, arg):
+        _import_dependencies()
         if isinstance(arg, pymargo.core.Engine):
             self._engine = arg
             self._owns_engine = False
@@ -48,6 +91,8 @@ class Client:
         else:
             raise TypeError(f'Invalid argument type {type(arg)}')
         self._internal = pyflock_client.Client(self._engine.get_internal_mid())
+        self._mid = self._internal.margo_instance_id
+        self._handle_cache = weakref.WeakValueDictionary()
 
     def __del__(self):
         del self._internal
@@ -57,26 +102,88 @@ class Client:
 
     @property
     def mid(self):
-        return self._internal.margo_instance_id
+        return self._mid
 
     @property
     def engine(self):
         return self._engine
 
-    def make_group_handle(self, address: str|pymargo.core.Address, provider_id: int = 0):
+    def clear_handle_cache(self):
+        self._handle_cache.clear()
+
+    @staticmethod
+    def _handle_key(address: str|pymargo.core.Address, provider_id: int):
+        # Address objects are keyed by their hg_addr_t capsule rather
+        # than by str(address), which would call margo_addr_to_string.
+        # Capsules compare by identity (see make_group_handle).
         if isinstance(address, pymargo.core.Address):
-            address = str(address)
-        return GroupHandle(
-            self._internal.make_group_handle(address=address, provider_id=provider_id),
-            self)
+            address = address.get_internal_hg_addr()
+        return (address, provider_id)
+
+    def make_group_handle(self, address: str|pymargo.core.Address, provider_id: int = 0):
+        """
+        Return a GroupHandle for the given address and provider ID.
+
+        Handles are cached while they are in use. String addresses are cached
+        by value. Address objects are cached by identity: passing the same
+        Address object again returns the cached handle, but another Address
+        object for the same endpoint (e.g. a new engine.address or
+        engine.lookup() result), or the same endpoint given as a string,
+        gives a separate handle.
+        """
+        key = self._handle_key(address, provider_id)
+        gh = self._handle_cache.get(key)
+        if gh is None:
+            gh = GroupHandle(
+                self._internal.make_group_handle(address=key[0], provider_id=provider_id),
+                self)
+            self._handle_cache[key] = gh
+        return gh
+
+    def make_group_handle_batch(self, addresses: list[str|pymargo.core.Address], provider_ids: list[int]):
+        if len(addresses) != len(provider_ids):
+            raise ValueError("addresses and provider_ids should have the same length")
+        keys = [self._handle_key(a, p) for a, p in zip(addresses, provider_ids)]
+        handles = [self._handle_cache.get(key) for key in keys]
+        # each missing destination is created once, even if repeated in the batch
+        missing = list(dict.fromkeys(key for key, gh in zip(keys, handles) if gh is None))
+        if missing:
+            internals = self._internal.make_group_handles(
+                addresses=[key[0] for key in missing],
+                provider_ids=[key[1] for key in missing])
+            created = {}
+            for key, internal in zip(missing, internals):
+                created[key] = GroupHandle(internal, self)
+                self._handle_cache[key] = created[key]
+            handles = [gh if gh is not None else created[key]
+                       for key, gh in zip(keys, handles)]
+        return handles
 
     def make_group_handle_from_file(self, filename: str):
-        return GroupHandle(
-            self._internal.make_group_handle_from_file(filename=filename),
-            self)
+        # the inode and size catch a rewrite (e.g. serialize_to_file's
+        # write-and-rename) that lands within the same mtime tick
+        try:
+            filename = os.path.abspath(filename)
+            st = os.stat(filename)
+            key = ("file", filename, st.st_ino, st.st_size, st.st_mtime_ns)
+        except OSError:
+            key = None
+        gh = self._handle_cache.get(key) if key else None
+        if gh is None:
+            gh = GroupHandle(
+                self._internal.make_group_handle_from_file(filename=filename),
+                self)
+            if key:
+                self._handle_cache[key] = gh
+        return gh
 
     def make_group_handle_from_serialized(self, serialized: str):
         return GroupHandle(
             self._internal.make_group_handle_from_serialized(serialized=serialized),
             self)
 
+    def make_group_handle_from_bytes(self, buf: bytes|bytearray|memoryview):
+        return GroupHandle(
+            self._internal.make_group_handle_from_buffer(buffer=buf),
+            self)
+
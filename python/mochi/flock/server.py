@@ -12,15 +12,33 @@
 """
 
 
+from __future__ import annotations
+
+import json
 import pyflock_common
 from .view import GroupView
-import pyflock_server
-import pymargo.core
-import pymargo
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pymargo.core
+
+# pyflock_server is imported by _import_dependencies() when the first
+# Provider is created; until then, this module attribute is None.
+pyflock_server = None
+
+
+def _import_dependencies():
+    global pyflock_server
+    if pyflock_server is not None:
+        return
+    import pyflock_server
 
 
 class Provider:
 
-    def __init__(self, engine: pymargo.core.Engine, provider_id: int, config: str, initial_view: GroupView):
+    def __init__(self, engine: pymargo.core.Engine, provider_id: int, config: str|dict, initial_view: GroupView):
+        _import_dependencies()
+        if isinstance(config, dict):
+            config = json.dumps(config)
         self._internal = pyflock_server.Provider(
             engine.get_internal_mid(), provider_id, config, initial_view)
@@ -1,5 +1,7 @@
 import unittest
 import json
+import os
+import tempfile
 import mochi.flock.client as mfc
 import mochi.flock.server as mfs
 from mochi.flock.view import GroupView
@@ -10,20 +12,20 @@ class TestClient(unittest.TestCase):
     def setUp(self):
         self.engine = pymargo.core.Engine("na+sm", pymargo.core.server)
         self.address = str(self.engine.address)
-        config = {
+        config = json.dumps({
             "group": {
                 "type": "static",
                 "config": {}
             }
-        }
+        })
         self.initial_view = GroupView()
-        for i in range(0, 5):
-            self.initial_view.members.add(self.address, i)
+        self.initial_view.members.add_many([(self.address, i) for i in range(0, 5)])
         self.initial_view.metadata.add("mykey", "myvalue")
         self.providers = []
+        # each provider takes ownership of (and empties) the view it is given
         for i in range(0, 5):
             self.providers.append(
-                mfs.Provider(self.engine, i, json.dumps(config), self.initial_view.copy()))
+                mfs.Provider(self.engine, i, config, self.initial_view.copy()))
         self.client = mfc.Client(self.engine)
 
     def tearDown(self):
@@ -38,12 +40,99 @@ class TestClient(unittest.TestCase):
         view = gh.view
         self.assertIsInstance(view, GroupView)
         self.assertEqual(len(view.members), 5)
-        for i in range(0, 5):
-            self.assertEqual(view.members[i].address, self.address)
-            self.assertEqual(view.members[i].provider_id, i)
+        self.assertEqual(view.members.to_list(),
+            [(self.address, i) for i in range(0, 5)])
         self.assertEqual(view.metadata["mykey"], "myvalue")
         print(view)
 
+    def test_view_cache(self):
+        gh = self.client.make_group_handle(self.address, 3)
+        gh.update()
+        view = gh.view
+        # the same shared view is returned until the next update
+        self.assertIs(gh.view, view)
+        gh.update()
+        self.assertIsNot(gh.view, view)
+        self.assertEqual(gh.view.to_dict(), view.to_dict())
+        # a copy is needed to get a view that can be modified
+        private_view = gh.view.copy()
+        private_view.members.add("other_address", 0)
+        self.assertEqual(len(gh.view.members), 5)
+
+    def test_make_group_handle_from_address(self):
+        address = self.engine.address
+        gh = self.client.make_group_handle(address, 3)
+        gh.update()
+        self.assertEqual(len(gh.view.members), 5)
+        self.assertIs(self.client.make_group_handle(address, 3), gh)
+        # handles for Address objects are cached by identity
+        self.assertIsNot(self.client.make_group_handle(self.engine.address, 3), gh)
+        self.assertIsNot(self.client.make_group_handle(self.address, 3), gh)
+
+    def test_handle_cache(self):
+        gh1 = self.client.make_group_handle(self.address, 3)
+        gh2 = self.client.make_group_handle(self.address, 3)
+        self.assertIs(gh1, gh2)
+        self.assertIsNot(gh1, self.client.make_group_handle(self.address, 2))
+        self.client.clear_handle_cache()
+        self.assertIsNot(gh1, self.client.make_group_handle(self.address, 3))
+
+    def test_make_group_handle_batch(self):
+        handles = self.client.make_group_handle_batch(
+            [self.address] * 5, list(range(0, 5)))
+        self.assertEqual(len(handles), 5)
+        for gh in handles:
+            gh.update()
+            self.assertEqual(len(gh.view.members), 5)
+        with self.assertRaises(ValueError):
+            self.client.make_group_handle_batch([self.address], [0, 1])
+
+    def test_make_group_handle_batch_cache(self):
+        gh = self.client.make_group_handle(self.address, 0)
+        handles = self.client.make_group_handle_batch(
+            [self.address] * 4, [0, 1, 1, 2])
+        self.assertIs(handles[0], gh)
+        self.assertIs(handles[1], handles[2])
+        self.assertIsNot(handles[1], handles[3])
+        self.assertIs(self.client.make_group_handle(self.address, 1), handles[1])
+
+    def test_make_group_handle_from_file_cache(self):
+        gh = self.client.make_group_handle(self.address, 3)
+        gh.update()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "group.json")
+            gh.view.serialize_to_file(filename)
+            gh1 = self.client.make_group_handle_from_file(filename)
+            self.assertIs(self.client.make_group_handle_from_file(filename), gh1)
+            # a relative path to the same file hits the cache
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                self.assertIs(self.client.make_group_handle_from_file("group.json"), gh1)
+            finally:
+                os.chdir(cwd)
+            # an immediate rewrite of the file gives a new handle
+            new_view = gh.view.copy()
+            new_view.members.add(self.address, 5)
+            new_view.serialize_to_file(filename)
+            gh2 = self.client.make_group_handle_from_file(filename)
+            self.assertIsNot(gh2, gh1)
+            self.assertEqual(len(gh2.view.members), 6)
+
+    def test_make_group_handle_batch_from_addresses(self):
+        handles = self.client.make_group_handle_batch(
+            [self.engine.address, self.address], [1, 2])
+        self.assertEqual(len(handles), 2)
+        for gh in handles:
+            gh.update()
+            self.assertEqual(len(gh.view.members), 5)
+
+    def test_make_group_handle_from_bytes(self):
+        gh = self.client.make_group_handle(self.address, 3)
+        gh.update()
+        gh2 = self.client.make_group_handle_from_bytes(gh.view.to_bytes())
+        self.assertEqual(gh2.view.to_dict(), gh.view.to_dict())
+
     def test_update(self):
         gh = self.client.make_group_handle(self.address, 3)
         gh.update()
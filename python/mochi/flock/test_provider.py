@@ -19,6 +19,10 @@ class TestClient(unittest.TestCase):
             initial_view.members.add(address, 42)
             provider = mfs.Provider(engine, 42, json.dumps(config), initial_view)
             del provider
+            initial_view = view.GroupView()
+            initial_view.members.add(address, 42)
+            provider = mfs.Provider(engine, 42, config, initial_view)
+            del provider
             engine.finalize()
 
 
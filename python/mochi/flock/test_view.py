@@ -1,8 +1,17 @@
 import unittest
 import json
+import os
+import tempfile
 from mochi.flock.view import GroupView
 
 
+def make_view(num_members=5, num_metadata=5):
+    view = GroupView()
+    view.members.add_many([(f"address{i}", i) for i in range(0, num_members)])
+    view.metadata.update({f"key{i}": f"value{i}" for i in range(0, num_metadata)})
+    return view
+
+
 class TestGroupView(unittest.TestCase):
 
     def test_init(self):
@@ -23,8 +32,10 @@ class TestGroupView(unittest.TestCase):
             assert view.members.exists(f"address{i}", i)
             assert not view.members.exists(f"address{i+1}", i)
             assert not view.members.exists(f"address{i}", i+1)
-            self.assertEqual(view.members[i].address, f"address{i}")
-            self.assertEqual(view.members[i].provider_id, i)
+        self.assertEqual(view.members.to_list(),
+            [(f"address{i}", i) for i in range(0, 5)])
+        self.assertEqual(view.members[4].address, "address4")
+        self.assertEqual(view.members[4].provider_id, 4)
         # erase member 3 via __delitem__
         del view.members[3]
         self.assertEqual(view.members.count, 4)
@@ -62,6 +73,53 @@ class TestGroupView(unittest.TestCase):
         self.assertEqual(view.metadata.count, 3)
         self.assertIsNone(view.metadata["key2"])
 
+    def test_members_add_many(self):
+        view = GroupView()
+        view.members.add_many([(f"address{i}", i) for i in range(0, 5)])
+        self.assertEqual(view.members.count, 5)
+        self.assertEqual(view.members.to_list(),
+            [(f"address{i}", i) for i in range(0, 5)])
+        # any iterable works, including generators
+        view.members.add_many((f"address{i}", i) for i in range(5, 8))
+        self.assertEqual(view.members.count, 8)
+        assert view.members.exists("address7", 7)
+        # a bad item raises TypeError and adds nothing
+        with self.assertRaises(TypeError):
+            view.members.add_many([("address8", 8), ("address9", "nine")])
+        self.assertEqual(view.members.count, 8)
+
+    def test_metadata_update(self):
+        view = GroupView()
+        view.metadata.update({f"key{i}": f"value{i}" for i in range(0, 5)})
+        self.assertEqual(view.metadata.count, 5)
+        self.assertEqual(view.metadata.to_dict(),
+            {f"key{i}": f"value{i}" for i in range(0, 5)})
+        # (key, value) pairs are accepted as well
+        view.metadata.update([("key5", "value5"), ("key6", "value6")])
+        self.assertEqual(view.metadata.count, 7)
+        self.assertEqual(view.metadata["key6"], "value6")
+        with self.assertRaises(TypeError):
+            view.metadata.update([("key7", "value7"), ("key8",)])
+        self.assertEqual(view.metadata.count, 7)
+
+    def test_members_to_list(self):
+        self.assertEqual(GroupView().members.to_list(), [])
+        view = make_view()
+        # members are kept sorted regardless of insertion order
+        view.members.add("address10", 10)
+        view.members.remove(3)
+        self.assertEqual(view.members.to_list(),
+            [("address0", 0), ("address1", 1), ("address10", 10),
+             ("address3", 3), ("address4", 4)])
+
+    def test_metadata_to_dict(self):
+        self.assertEqual(GroupView().metadata.to_dict(), {})
+        view = make_view()
+        view.metadata.add("key0", "newvalue")
+        view.metadata.remove("key3")
+        self.assertEqual(view.metadata.to_dict(),
+            {"key0": "newvalue", "key1": "value1", "key2": "value2", "key4": "value4"})
+
     def test_str(self):
         view = GroupView()
         # add 5 metadata
@@ -89,6 +147,41 @@ class TestGroupView(unittest.TestCase):
             self.assertEqual(val, f"value{i}")
             i = i + 1
 
+    def test_to_dict(self):
+        view = make_view()
+        v = view.to_dict()
+        self.assertEqual(v, json.loads(str(view)))
+        self.assertEqual(v["members"],
+            [{"address": f"address{i}", "provider_id": i} for i in range(0, 5)])
+        self.assertEqual(v["metadata"],
+            {f"key{i}": f"value{i}" for i in range(0, 5)})
+
+    def test_serialize_to_file(self):
+        view = make_view()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "view.json")
+            view.serialize_to_file(filename)
+            with open(filename) as f:
+                self.assertEqual(json.load(f), view.to_dict())
+
+    def test_copy(self):
+        view = make_view()
+        view_copy = view.copy()
+        self.assertEqual(view_copy.to_dict(), view.to_dict())
+        self.assertEqual(view_copy.digest, view.digest)
+        view_copy.members.remove(0)
+        self.assertEqual(view.members.count, 5)
+        self.assertNotEqual(view_copy.digest, view.digest)
+
+    def test_bytes(self):
+        view = make_view()
+        buf = view.to_bytes()
+        self.assertIsInstance(buf, bytes)
+        for b in [buf, bytearray(buf), memoryview(buf)]:
+            view_copy = GroupView.from_buffer(b)
+            self.assertEqual(view_copy.to_dict(), view.to_dict())
+            self.assertEqual(view_copy.digest, view.digest)
+
     def test_digest(self):
         view = GroupView()
         self.assertEqual(view.digest, 0)
@@ -98,6 +191,17 @@ class TestGroupView(unittest.TestCase):
         view.metadata.add("key", "value")
         self.assertNotEqual(view.digest, 0)
         self.assertNotEqual(view.digest, d)
+        view.metadata.remove("key")
+        self.assertEqual(view.digest, d)
+        view.members.remove("address", 1)
+        self.assertEqual(view.digest, 0)
+
+    def test_locked_context_manager(self):
+        view = GroupView()
+        with view.locked() as v:
+            self.assertIs(v, view)
+            v.members.add("address", 1)
+        self.assertEqual(view.members.count, 1)
 
 if __name__ == '__main__':
     unittest.main()
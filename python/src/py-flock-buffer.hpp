@@ -0,0 +1,19 @@
+/*
+ * (C) 2024 The University of Chicago
+ *
+ * See COPYRIGHT in top-level directory.
+ */
+#ifndef __PY_FLOCK_BUFFER_HPP
+#define __PY_FLOCK_BUFFER_HPP
+
+#include <pybind11/pybind11.h>
+#include <stdexcept>
+#include <string_view>
+
+inline std::string_view buffer_to_string_view(const pybind11::buffer_info& info) {
+    if(info.ndim != 1 || info.itemsize != 1 || info.strides[0] != 1)
+        throw std::invalid_argument{"Buffer should be a contiguous sequence of bytes"};
+    return std::string_view{static_cast<const char*>(info.ptr), static_cast<size_t>(info.size)};
+}
+
+#endif
@@ -5,9 +5,11 @@
  */
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include "py-flock-buffer.hpp"
 #include <flock/cxx/client.hpp>
 #include <flock/cxx/group-view.hpp>
 #include <flock/cxx/group.hpp>
+#include <optional>
 
 namespace py11 = pybind11;
 using namespace pybind11::literals;
@@ -15,9 +17,11 @@ using namespace pybind11::literals;
 struct margo_instance;
 typedef struct margo_instance* margo_instance_id;
 typedef py11::capsule pymargo_instance_id;
+typedef py11::capsule pyhg_addr_t;
 
 #define MID2CAPSULE(__mid)   py11::capsule((void*)(__mid), "margo_instance_id")
 #define CAPSULE2MID(__caps)  (margo_instance_id)(__caps)
+#define CAPSULE2ADDR(__caps) (hg_addr_t)(__caps)
 
 PYBIND11_MODULE(pyflock_client, m) {
     m.doc() = "Flock client python extension";
@@ -36,14 +40,63 @@ PYBIND11_MODULE(pyflock_client, m) {
                 auto addr = client.engine().lookup(address);
                 return client.makeGroupHandle(addr.get_addr(), provider_id);
              },
+             py11::call_guard<py11::gil_scoped_release>(),
              "Create a GroupHandle instance",
              "address"_a,
              "provider_id"_a=0)
+        .def("make_group_handle",
+             [](const flock::Client& client,
+                pyhg_addr_t address,
+                uint16_t provider_id) {
+                auto addr = CAPSULE2ADDR(address);
+                py11::gil_scoped_release release;
+                return client.makeGroupHandle(addr, provider_id);
+             },
+             "Create a GroupHandle instance from an already resolved address",
+             "address"_a,
+             "provider_id"_a=0)
+        .def("make_group_handles",
+             [](const flock::Client& client,
+                const std::vector<py11::object>& addresses,
+                const std::vector<uint16_t>& provider_ids) {
+                if(addresses.size() != provider_ids.size())
+                    throw std::invalid_argument{
+                        "addresses and provider_ids should have the same length"};
+                // addresses are either strings to look up or already resolved hg_addr_t
+                struct target {
+                    std::string address;
+                    hg_addr_t   addr = HG_ADDR_NULL;
+                };
+                std::vector<target> targets;
+                targets.reserve(addresses.size());
+                for(const auto& address : addresses) {
+                    if(py11::isinstance<py11::capsule>(address))
+                        targets.push_back({std::string{}, CAPSULE2ADDR(address.cast<pyhg_addr_t>())});
+                    else
+                        targets.push_back({address.cast<std::string>(), HG_ADDR_NULL});
+                }
+                std::vector<flock::GroupHandle> handles;
+                handles.reserve(targets.size());
+                py11::gil_scoped_release release;
+                for(size_t i = 0; i < targets.size(); ++i) {
+                    if(targets[i].addr != HG_ADDR_NULL) {
+                        handles.push_back(client.makeGroupHandle(targets[i].addr, provider_ids[i]));
+                    } else {
+                        auto addr = client.engine().lookup(targets[i].address);
+                        handles.push_back(client.makeGroupHandle(addr.get_addr(), provider_ids[i]));
+                    }
+                }
+                return handles;
+             },
+             "Create a list of GroupHandle instances",
+             "addresses"_a,
+             "provider_ids"_a)
         .def("make_group_handle_from_file",
              [](const flock::Client& client,
                 const std::string& filename) {
                 return flock::GroupHandle::FromFile(client, filename.c_str());
              },
+             py11::call_guard<py11::gil_scoped_release>(),
              "Create a GroupHandle instance",
              "filename"_a)
         .def("make_group_handle_from_serialized",
@@ -51,11 +104,26 @@ PYBIND11_MODULE(pyflock_client, m) {
                 std::string_view serialized) {
                 return flock::GroupHandle::FromSerialized(client, serialized);
              },
+             py11::call_guard<py11::gil_scoped_release>(),
              "Create a GroupHandle instance",
              "serialized"_a)
+        .def("make_group_handle_from_buffer",
+             [](const flock::Client& client,
+                py11::buffer buffer) {
+                auto info = buffer.request();
+                auto serialized = buffer_to_string_view(info);
+                // json-c parses the buffer in place, so the GIL is only released
+                // for bytes, which no other Python thread can modify meanwhile
+                std::optional<py11::gil_scoped_release> release;
+                if(py11::isinstance<py11::bytes>(buffer)) release.emplace();
+                return flock::GroupHandle::FromSerialized(client, serialized);
+             },
+             "Create a GroupHandle instance",
+             "buffer"_a)
     ;
     py11::class_<flock::GroupHandle>(m, "GroupHandle")
-        .def("update", &flock::GroupHandle::update)
+        .def("update", &flock::GroupHandle::update,
+             py11::call_guard<py11::gil_scoped_release>())
         .def_property_readonly("view", &flock::GroupHandle::view)
     ;
 }
@@ -5,6 +5,7 @@
  */
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include "py-flock-buffer.hpp"
 #include <flock/cxx/exception.hpp>
 #include <flock/cxx/group-view.hpp>
 
@@ -18,6 +19,48 @@ typedef py11::capsule pymargo_instance_id;
 #define MID2CAPSULE(__mid)   py11::capsule((void*)(__mid), "margo_instance_id")
 #define CAPSULE2MID(__caps)  (margo_instance_id)(__caps)
 
+template<typename T>
+static std::vector<T> cast_items(py11::iterable items, const char* error) {
+    std::vector<T> result;
+    for(auto item : items) {
+        try {
+            result.push_back(item.cast<T>());
+        } catch(const py11::cast_error&) {
+            throw py11::type_error{error};
+        }
+    }
+    return result;
+}
+
+static py11::dict member_to_dict(const flock::GroupView::Member& member) {
+    return py11::dict("address"_a=member.address, "provider_id"_a=member.provider_id);
+}
+
+static py11::tuple member_to_tuple(const flock::GroupView::Member& member) {
+    return py11::make_tuple(member.address, member.provider_id);
+}
+
+template<typename Convert>
+static py11::list members_to_list(const flock::GroupView::MembersProxy& proxy, Convert&& convert) {
+    py11::list result(proxy.count());
+    for(size_t i = 0; i < proxy.count(); ++i)
+        result[i] = convert(proxy[i]);
+    return result;
+}
+
+static py11::dict metadata_to_dict(const flock::GroupView::MetadataProxy& proxy) {
+    py11::dict result;
+    for(size_t i = 0; i < proxy.count(); ++i) {
+        auto md = proxy[i];
+        result[py11::str(md.key)] = md.value;
+    }
+    return result;
+}
+
+struct GroupViewLock {
+    flock::GroupView& view;
+};
+
 PYBIND11_MODULE(pyflock_common, m) {
     m.doc() = "Flock common python extension";
     py11::register_exception<flock::Exception>(m, "Exception", PyExc_RuntimeError);
@@ -35,6 +78,14 @@ PYBIND11_MODULE(pyflock_common, m) {
         .def_property_readonly("count", &flock::GroupView::MembersProxy::count)
         .def("add", &flock::GroupView::MembersProxy::add,
              "address"_a, "provider_id"_a)
+        .def("add_many", [](flock::GroupView::MembersProxy& proxy, py11::iterable members) {
+            // convert everything first so that a bad item leaves the view unchanged
+            auto items = cast_items<std::pair<std::string, uint16_t>>(
+                members, "add_many expects (address, provider_id) pairs");
+            for(const auto& [address, provider_id] : items)
+                proxy.add(address.c_str(), provider_id);
+        }, "Add members from an iterable of (address, provider_id) pairs",
+           "members"_a)
         .def("remove", [](flock::GroupView::MembersProxy& proxy, size_t i) {
             proxy.remove(i);
         }, "index"_a)
@@ -48,6 +99,9 @@ PYBIND11_MODULE(pyflock_common, m) {
         .def("__delitem__", [](flock::GroupView::MembersProxy& proxy, size_t i) {
             proxy.remove(i);
         }, "index"_a)
+        .def("to_list", [](const flock::GroupView::MembersProxy& proxy) {
+            return members_to_list(proxy, member_to_tuple);
+        })
         ;
 
     py11::class_<flock::GroupView::MetadataProxy>(m, "MetadataProxy")
@@ -55,6 +109,16 @@ PYBIND11_MODULE(pyflock_common, m) {
         .def_property_readonly("count", &flock::GroupView::MetadataProxy::count)
         .def("add", &flock::GroupView::MetadataProxy::add,
              "key"_a, "value"_a)
+        .def("update", [](flock::GroupView::MetadataProxy& proxy, py11::object metadata) {
+            // like dict.update, accept a mapping or an iterable of (key, value) pairs
+            py11::iterable pairs = py11::hasattr(metadata, "items") ?
+                metadata.attr("items")() : metadata;
+            auto items = cast_items<std::pair<std::string, std::string>>(
+                pairs, "update expects a mapping or (key, value) pairs");
+            for(const auto& [key, value] : items)
+                proxy.add(key.c_str(), value.c_str());
+        }, "Add metadata from a mapping or an iterable of (key, value) pairs",
+           "metadata"_a)
         .def("remove", &flock::GroupView::MetadataProxy::remove,
              "key"_a)
         .def("__getitem__", [](flock::GroupView::MetadataProxy& proxy, const std::string& key) {
@@ -65,6 +129,17 @@ PYBIND11_MODULE(pyflock_common, m) {
         }, "index"_a)
         .def("__delitem__", &flock::GroupView::MetadataProxy::remove,
            "key"_a)
+        .def("to_dict", &metadata_to_dict)
+        ;
+
+    py11::class_<GroupViewLock>(m, "GroupViewLock")
+        .def("__enter__", [](GroupViewLock& l) -> flock::GroupView& {
+            l.view.lock();
+            return l.view;
+        }, py11::return_value_policy::reference)
+        .def("__exit__", [](GroupViewLock& l, py11::args) {
+            l.view.unlock();
+        })
         ;
 
     py11::class_<flock::GroupView>(m, "GroupView")
@@ -73,11 +148,29 @@ PYBIND11_MODULE(pyflock_common, m) {
         .def("clear", &flock::GroupView::clear)
         .def("lock", &flock::GroupView::lock)
         .def("unlock", &flock::GroupView::unlock)
+        .def("locked", [](flock::GroupView& gv) {
+            return GroupViewLock{gv};
+        }, py11::keep_alive<0, 1>())
         .def_property_readonly("members", &flock::GroupView::members, py11::keep_alive<0, 1>())
         .def_property_readonly("metadata", &flock::GroupView::metadata, py11::keep_alive<0, 1>())
         .def("__str__", [](const flock::GroupView& gv) {
                 return static_cast<std::string>(gv);
         })
+        .def("to_dict", [](flock::GroupView& gv) {
+                return py11::dict(
+                    "members"_a=members_to_list(gv.members(), member_to_dict),
+                    "metadata"_a=metadata_to_dict(gv.metadata()));
+        })
+        .def("serialize_to_file", [](const flock::GroupView& gv, const std::string& filename) {
+                gv.serializeToFile(filename.c_str());
+        }, "filename"_a)
+        .def("to_bytes", [](const flock::GroupView& gv) {
+                return py11::bytes(static_cast<std::string>(gv));
+        })
+        .def_static("from_buffer", [](py11::buffer buffer) {
+                auto info = buffer.request();
+                return flock::GroupView::FromString(buffer_to_string_view(info));
+        }, "buffer"_a)
         .def("copy", &flock::GroupView::copy)
         ;
 }
@@ -146,6 +146,24 @@ TEST_CASE("Test group view interface", "[group-view]") {
             REQUIRE(p.second == value);
         }
 
+        // Copy the view
+        flock_group_view_t view_copy = FLOCK_GROUP_VIEW_INITIALIZER;
+        b = flock_group_view_copy(&view, &view_copy);
+        REQUIRE(b);
+        REQUIRE(view_copy.digest == view.digest);
+        REQUIRE(view_copy.members.size == view.members.size);
+        REQUIRE(view_copy.metadata.size == view.metadata.size);
+        for(size_t i = 0; i < view.members.size; ++i) {
+            REQUIRE(view_copy.members.data[i].address != view.members.data[i].address);
+            REQUIRE(std::string{view_copy.members.data[i].address} == view.members.data[i].address);
+            REQUIRE(view_copy.members.data[i].provider_id == view.members.data[i].provider_id);
+        }
+        for(size_t i = 0; i < view.metadata.size; ++i) {
+            REQUIRE(std::string{view_copy.metadata.data[i].key} == view.metadata.data[i].key);
+            REQUIRE(std::string{view_copy.metadata.data[i].value} == view.metadata.data[i].value);
+        }
+        flock_group_view_clear(&view_copy);
+
         auto members_data = view.members.data;
         auto members_size = view.members.size;
         auto members_capa = view.members.capacity;